@@ -10,7 +10,7 @@ from flask import Flask
 from flask_cors import CORS
 
 from routes import (
-    upload_pdf_handler, get_events_handler, create_event_handler,
+    upload_pdf_handler, upload_status_handler, get_events_handler, create_event_handler,
     update_event_handler, delete_event_handler, health_check_handler,
     export_ics_handler
 )
@@ -40,6 +40,11 @@ def upload_pdf():
     """Upload and process PDF syllabus to extract deadlines"""
     return upload_pdf_handler()
 
+@app.route('/upload-pdf/<job_id>', methods=['GET'])
+def upload_status(job_id):
+    """Poll a PDF upload that is still being processed"""
+    return upload_status_handler(job_id)
+
 @app.route('/events', methods=['GET'])
 def get_events():
     """Get all events"""
@@ -6,23 +6,99 @@ of academic deadlines from syllabus text using advanced regex patterns.
 """
 
 import re
-from typing import List, Dict, Any
-from dateutil import parser
+from datetime import datetime
+from functools import lru_cache
+from typing import List, Dict, Any, Optional
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Constants for text processing
+IGNORE_SECTIONS = (
+    "Course Description",
+    "Learning Outcomes",
+    "Late Policy",
+    "Office Hours",
+    "Resources",
+    "Academic Integrity",
+)
 IGNORE_SECTIONS_RE = re.compile(
-    r"\b(Course Description|Learning Outcomes|Late Policy|Office Hours|Resources|Academic Integrity)\b",
-    re.IGNORECASE,
+    rf"\b({'|'.join(map(re.escape, IGNORE_SECTIONS))})\b",
+    re.IGNORECASE | re.ASCII,
 )
 
-# Date and time regex patterns
+def _build_ignore_automaton():
+    """Build an Aho-Corasick automaton over the lowercased section headers."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for header in IGNORE_SECTIONS:
+        automaton.add_word(header.lower(), len(header))
+    automaton.make_automaton()
+    return automaton
+
+_IGNORE_AUTOMATON = _build_ignore_automaton()
+
+# Date and time regex patterns (all literals are ASCII, so re.ASCII keeps
+# case-insensitive matching on the cheap ASCII tables)
 MONTH_RE = r"(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:t(?:ember)?)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)"
-DAY_RE = r"\d{1,2}(?:st|nd|rd|th)?"
 YEAR_RE = r"\d{4}"
-DATE_RE = re.compile(rf"{MONTH_RE}\s+{DAY_RE},?\s+{YEAR_RE}", re.IGNORECASE)
+DATE_RE = re.compile(
+    rf"(?P<mon>{MONTH_RE})\s+(?P<day>\d{{1,2}})(?:st|nd|rd|th)?,?\s+(?P<year>{YEAR_RE})",
+    re.IGNORECASE | re.ASCII,
+)
 TIME_RE = r"\d{1,2}:\d{2}\s?(?:AM|PM)"
-RANGE_RE = re.compile(rf"{TIME_RE}\s*[\-\u2013\u2014]\s*{TIME_RE}", re.IGNORECASE)
-SINGLE_TIME_RE = re.compile(TIME_RE, re.IGNORECASE)
+CLOCK_RE = re.compile(
+    r"(?P<hour>\d{1,2}):(?P<minute>\d{2})\s?(?P<ampm>AM|PM)",
+    re.IGNORECASE | re.ASCII,
+)
+# Up to 120 characters after a date, stopping before the next date so one
+# date never takes another date's time
+TIME_GAP_RE = rf"(?:(?!\b{MONTH_RE}\s+\d).){{0,120}}?"
+# A date optionally followed by a time range (t1-t2) or, failing that, a
+# single time (t3), matched in one pass
+DATE_TIME_RE = re.compile(
+    rf"(?P<date>{DATE_RE.pattern})"
+    rf"(?:{TIME_GAP_RE}(?P<t1>{TIME_RE})\s*[\-\u2013\u2014]\s*(?P<t2>{TIME_RE})"
+    rf"|{TIME_GAP_RE}(?P<t3>{TIME_RE}))?",
+    re.IGNORECASE | re.ASCII | re.DOTALL,
+)
+
+# Title cleanup patterns (compiled once, used for every date match)
+_SEG_SPLIT_RE = re.compile(r"[.;|]\s*|\(\s*\d+%\s*\)")
+_PCT_RE = re.compile(r"\b\d+%\b")
+_COMPONENT_RE = re.compile(
+    r"\b(Component|Weight|Date\s*/?\s*Deadline|Important Dates)\b",
+    re.IGNORECASE | re.ASCII,
+)
+_WS_RE = re.compile(r"\s+")
+# Folds ';' into ',' so multi-event titles can be split with str.split
+_DELIM_TBL = str.maketrans({";": ","})
+
+# Event type keywords fused into one pattern; group names are the event types
+_TYPE_RE = re.compile(
+    r"(?P<Midterm>\bmidterm\b)"
+    r"|(?P<Exam>\b(?:final|exam|test)\b)"
+    r"|(?P<Quiz>\bquiz\b)"
+    r"|(?P<Lab>\blab\b)"
+    r"|(?P<Assignment>\bassignment\b|\bhw\b|\bhomework\b)"
+    r"|(?P<Project>\bproject|presentation|report\b)"
+)
+# Keyword precedence when a title mentions several types (lower wins)
+_TYPE_PRIORITY = {
+    "Midterm": 0, "Exam": 1, "Quiz": 2, "Lab": 3, "Assignment": 4, "Project": 5,
+}
+
+# Emoji and symbol ranges stripped by clean_text
+_EMOJI_RE = re.compile(r"[\u2600-\u27BF\U0001F300-\U0001FAFF]")
+
+# Month number lookup keyed by the three-letter prefix matched by MONTH_RE
+_MONTHS = {
+    "jan": 1, "feb": 2, "mar": 3, "apr": 4, "may": 5, "jun": 6,
+    "jul": 7, "aug": 8, "sep": 9, "oct": 10, "nov": 11, "dec": 12,
+}
 
 def clean_text(raw: str) -> str:
     """
@@ -41,37 +117,122 @@ def clean_text(raw: str) -> str:
     """
     txt = raw.replace("\u2013", "-").replace("\u2014", "-")
     # Remove emojis and symbols (Unicode ranges for emojis)
-    txt = re.sub(r"[\u2600-\u27BF\U0001F300-\U0001FAFF]", " ", txt)
+    txt = _EMOJI_RE.sub(" ", txt)
     # Normalize whitespace
-    txt = re.sub(r"\s+", " ", txt)
+    txt = _WS_RE.sub(" ", txt)
     return txt.strip()
 
-def guess_event_type(title: str) -> str:
+def _is_word_char(ch: str) -> bool:
+    """Return True for characters that count as (ASCII) regex word characters."""
+    return ch.isascii() and (ch.isalnum() or ch == "_")
+
+def remove_ignored_sections(txt: str) -> str:
+    """
+    Blank out non-academic section headers (see IGNORE_SECTIONS).
+    
+    Uses a single Aho-Corasick pass when pyahocorasick is installed and
+    falls back to IGNORE_SECTIONS_RE otherwise.
+    
+    Args:
+        txt: Cleaned syllabus text
+        
+    Returns:
+        str: Text with each whole-word header replaced by a space
+    """
+    lowered = txt.lower()
+    # Lowercasing can change length for a few code points; spans would drift
+    if _IGNORE_AUTOMATON is None or len(lowered) != len(txt):
+        return IGNORE_SECTIONS_RE.sub(" ", txt)
+
+    pieces = []
+    last = 0
+    for end, length in _IGNORE_AUTOMATON.iter(lowered):
+        start = end - length + 1
+        if start < last:
+            continue
+        if start > 0 and _is_word_char(txt[start - 1]):
+            continue
+        if end + 1 < len(txt) and _is_word_char(txt[end + 1]):
+            continue
+        pieces.append(txt[last:start])
+        pieces.append(" ")
+        last = end + 1
+
+    if not pieces:
+        return txt
+    pieces.append(txt[last:])
+    return "".join(pieces)
+
+def parse_date_match(date_match: re.Match) -> datetime:
+    """
+    Build a datetime from a DATE_RE match without a generic date parser.
+    
+    Args:
+        date_match: Match object produced by DATE_RE or DATE_TIME_RE
+        
+    Returns:
+        datetime: Midnight on the matched date
+        
+    Raises:
+        ValueError: If the matched day does not exist (e.g. Feb 30)
+    """
+    return datetime(
+        int(date_match.group("year")),
+        _MONTHS[date_match.group("mon")[:3].lower()],
+        int(date_match.group("day")),
+    )
+
+def combine_time(date_base: datetime, time_text: str) -> datetime:
+    """
+    Apply an "H:MM AM/PM" time string to a date.
+    
+    Args:
+        date_base: Date the time belongs to
+        time_text: Time text matched by TIME_RE
+        
+    Returns:
+        datetime: The date with hour and minute set
+        
+    Raises:
+        ValueError: If the time is not a valid clock time
+    """
+    clock = CLOCK_RE.search(time_text)
+    if not clock:
+        raise ValueError(f"Unrecognized time: {time_text}")
+    hour = int(clock.group("hour"))
+    if hour > 12:
+        raise ValueError(f"Invalid hour: {time_text}")
+    hour %= 12
+    if clock.group("ampm").upper() == "PM":
+        hour += 12
+    return date_base.replace(hour=hour, minute=int(clock.group("minute")))
+
+@lru_cache(maxsize=1024)
+def guess_event_type(title: str, title_lower: Optional[str] = None) -> str:
     """
     Determine the event type based on keywords in the title.
     
+    Results are memoized since syllabi repeat the same titles often.
+    
     Args:
         title: The event title to analyze
+        title_lower: Precomputed ``title.lower()``, if the caller already has it
         
     Returns:
         str: One of the allowed event types
     """
-    title_lower = title.lower()
+    if title_lower is None:
+        title_lower = title.lower()
     
-    if re.search(r"\bmidterm\b", title_lower):
-        return "Midterm"
-    elif re.search(r"\b(final|exam|test)\b", title_lower):
-        return "Exam"
-    elif re.search(r"\bquiz\b", title_lower):
-        return "Quiz"
-    elif re.search(r"\blab\b", title_lower):
-        return "Lab"
-    elif re.search(r"\bassignment\b|\bhw\b|\bhomework\b", title_lower):
-        return "Assignment"
-    elif re.search(r"\bproject|presentation|report\b", title_lower):
-        return "Project"
-    else:
-        return "Other"
+    best = "Other"
+    best_rank = len(_TYPE_PRIORITY)
+    for match in _TYPE_RE.finditer(title_lower):
+        rank = _TYPE_PRIORITY[match.lastgroup]
+        if rank < best_rank:
+            best, best_rank = match.lastgroup, rank
+            if rank == 0:
+                break
+    return best
 
 def extract_deadlines_from_text(text: str) -> List[Dict[str, Any]]:
     """
@@ -94,78 +255,64 @@ def extract_deadlines_from_text(text: str) -> List[Dict[str, Any]]:
     # Clean the input text
     cleaned = clean_text(text)
     # Remove non-academic sections
-    cleaned = IGNORE_SECTIONS_RE.sub(" ", cleaned)
+    cleaned = remove_ignored_sections(cleaned)
 
     results = []
     seen = set()  # Track seen events to prevent duplicates
 
     # Find all date patterns in the text
-    for date_match in DATE_RE.finditer(cleaned):
-        date_text = date_match.group(0)
-        
+    for date_match in DATE_TIME_RE.finditer(cleaned):
+        # Time information captured right after the date, if any
+        start_text = date_match.group('t1') or date_match.group('t3')
+        end_text = date_match.group('t2')
+
         try:
-            # Parse the date to ensure it's valid
-            date_base = parser.parse(date_text)
-        except Exception:
-            # Skip dates that can't be parsed
+            # Build the date from the captured groups to ensure it's valid
+            date_base = parse_date_match(date_match)
+            
+            # Determine start/end times
+            if end_text:
+                # Time range found (e.g., "7:00 PM – 9:00 PM")
+                start_time = combine_time(date_base, start_text)
+                end_time = combine_time(date_base, end_text)
+            elif start_text:
+                # Single time found (e.g., "7:00 PM")
+                start_time = end_time = combine_time(date_base, start_text)
+            else:
+                # No time specified - all day event
+                start_time = end_time = date_base
+        except ValueError:
+            # Skip dates or times that can't be parsed (e.g. Feb 30, 13:00 PM)
             continue
+        
+        start_iso = start_time.isoformat()
+        end_iso = end_time.isoformat()
+        all_day = start_text is None
 
         # Create a context window around the date for title extraction
         start_idx = max(0, date_match.start() - 120)
-        end_idx = min(len(cleaned), date_match.end() + 120)
+        end_idx = min(len(cleaned), date_match.end('date') + 120)
         snippet = cleaned[start_idx:end_idx].strip()
 
         # Extract title from text before the date
         before_text = cleaned[start_idx:date_match.start()].strip()
         
         # Split on common delimiters and take the last segment
-        segments = re.split(r"[.;|]\s*|\(\s*\d+%\s*\)", before_text)
+        segments = _SEG_SPLIT_RE.split(before_text)
         title_raw = (segments[-1] if segments else before_text).strip()
         
         # Clean up the title
-        title_raw = re.sub(r"\b\d+%\b", "", title_raw).strip()  # Remove percentage weights
-        title_raw = re.sub(
-            r"\b(Component|Weight|Date\s*/?\s*Deadline|Important Dates)\b", 
-            "", 
-            title_raw, 
-            flags=re.IGNORECASE
-        ).strip()
+        title_raw = _PCT_RE.sub("", title_raw).strip()  # Remove percentage weights
+        title_raw = _COMPONENT_RE.sub("", title_raw).strip()
         
         # Default title if none found
         if not title_raw:
             title_raw = "Assignment"
 
-        # Check for time information after the date
-        after_text = cleaned[date_match.end():end_idx]
-        time_range_match = RANGE_RE.search(after_text)
-        single_time_match = SINGLE_TIME_RE.search(after_text) if not time_range_match else None
-
-        # Determine start/end times and all-day status
-        if time_range_match:
-            # Time range found (e.g., "7:00 PM – 9:00 PM")
-            range_text = time_range_match.group(0)
-            time_parts = re.split(r"[\-\u2013\u2014]", range_text)
-            start_time = parser.parse(f"{date_text} {time_parts[0].strip()}")
-            end_time = parser.parse(f"{date_text} {time_parts[1].strip()}")
-            start_iso = start_time.isoformat()
-            end_iso = end_time.isoformat()
-            all_day = False
-        elif single_time_match:
-            # Single time found (e.g., "7:00 PM")
-            start_time = parser.parse(f"{date_text} {single_time_match.group(0)}")
-            start_iso = start_time.isoformat()
-            end_iso = start_time.isoformat()
-            all_day = False
-        else:
-            # No time specified - all day event
-            date_only = date_base.replace(hour=0, minute=0, second=0, microsecond=0)
-            start_iso = end_iso = date_only.isoformat()
-            all_day = True
-
         # Handle multiple events on the same line (comma/semicolon separated)
         event_titles = [
             t.strip(" -:") 
-            for t in re.split(r",|;", title_raw) 
+            for t in title_raw.translate(_DELIM_TBL).split(",") 
             if len(t.strip()) > 2
         ]
         
@@ -174,15 +321,16 @@ def extract_deadlines_from_text(text: str) -> List[Dict[str, Any]]:
 
         # Create an event for each title
         for title in event_titles:
-            title = re.sub(r"\s+", " ", title)  # Normalize whitespace
-            event_type = guess_event_type(title)
+            title = _WS_RE.sub(" ", title)  # Normalize whitespace
+            title_lower = title.lower()
             
             # Create unique key for duplicate detection
-            event_key = f"{title.lower()}_{start_iso[:10]}"
+            event_key = (title_lower, start_iso[:10])
             
             if event_key in seen:
                 continue
-                
+            
+            event_type = guess_event_type(title, title_lower)
             results.append({
                 'title': title,
                 'type': event_type,
@@ -5,6 +5,7 @@ This module contains the data structures, constants, and helper functions
 used throughout the application for managing events and configuration.
 """
 
+import threading
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 
@@ -13,7 +14,11 @@ ALLOWED_TYPES = ["Lab", "Assignment", "Exam", "Midterm", "Quiz", "Project", "Oth
 
 # In-memory storage for events (in production, use a database)
 events: List[Dict[str, Any]] = []
+# Index of the same event dicts keyed by ID for constant-time lookups
+_events_by_id: Dict[int, Dict[str, Any]] = {}
 next_event_id: int = 1
+# Guards next_event_id; IDs are allocated from request and worker threads
+_id_lock = threading.Lock()
 
 class Event:
     """
@@ -87,18 +92,37 @@ class Event:
 
 def get_next_event_id() -> int:
     """Get the next available event ID and increment the counter."""
+    return reserve_event_ids(1)
+
+def reserve_event_ids(count: int) -> int:
+    """
+    Reserve a contiguous block of event IDs.
+    
+    Args:
+        count: Number of IDs to reserve
+        
+    Returns:
+        int: The first reserved ID; the block is [first, first + count)
+    """
     global next_event_id
-    current_id = next_event_id
-    next_event_id += 1
-    return current_id
+    with _id_lock:
+        first_id = next_event_id
+        next_event_id += count
+    return first_id
 
 def add_event(event: Event) -> None:
     """Add an event to the in-memory storage."""
-    events.append(event.to_dict())
+    add_event_dict(event.to_dict())
 
 def add_event_dict(event_dict: Dict[str, Any]) -> None:
     """Add an event dictionary directly to the in-memory storage."""
     events.append(event_dict)
+    _events_by_id[event_dict['id']] = event_dict
+
+def add_event_dicts(event_dicts: List[Dict[str, Any]]) -> None:
+    """Add a batch of event dictionaries to the in-memory storage."""
+    events.extend(event_dicts)
+    _events_by_id.update((e['id'], e) for e in event_dicts)
 
 def get_all_events() -> List[Dict[str, Any]]:
     """Get all events from storage."""
@@ -106,7 +130,7 @@ def get_all_events() -> List[Dict[str, Any]]:
 
 def get_event_by_id(event_id: int) -> Optional[Dict[str, Any]]:
     """Get a specific event by its ID."""
-    return next((e for e in events if e['id'] == event_id), None)
+    return _events_by_id.get(event_id)
 
 def update_event(event_id: int, updates: Dict[str, Any]) -> bool:
     """
@@ -139,7 +163,10 @@ def delete_event(event_id: int) -> bool:
     Returns:
         bool: True if event was found and deleted, False otherwise
     """
-    global events
-    original_length = len(events)
-    events = [e for e in events if e['id'] != event_id]
-    return len(events) < original_length
+    event = _events_by_id.pop(event_id, None)
+    if event is None:
+        return False
+    
+    # Remove in place so modules holding a reference to `events` stay in sync
+    events.remove(event)
+    return True
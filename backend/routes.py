@@ -5,24 +5,60 @@ This module contains all the Flask route handlers for the REST API,
 including file upload, event CRUD operations, and health checks.
 """
 
-from flask import request, jsonify, Response
+from flask import request, jsonify, Response, stream_with_context
+import orjson
 import PyPDF2
-import io
-from typing import Dict, Any
-from datetime import datetime
-import pytz
-from icalendar import Calendar, Event as ICalEvent
+import shutil
+import tempfile
+import time
+import uuid
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Dict, Any, Tuple
+from datetime import datetime, timezone
 
 from models import (
-    get_next_event_id, get_all_events, 
-    get_event_by_id, update_event, delete_event, events, next_event_id
+    get_next_event_id, reserve_event_ids, get_all_events,
+    get_event_by_id, update_event, delete_event, add_event_dict, add_event_dicts, events
 )
 from extractor import extract_deadlines_from_text
 
+# Uploads up to this size stay in memory; larger ones spill to a temp file.
+# Matches Werkzeug's own form-data spooling limit, so copying the upload
+# never pulls a file Werkzeug kept on disk back into RAM.
+UPLOAD_SPOOL_MAX_SIZE = 500 * 1024
+UPLOAD_COPY_CHUNK_SIZE = 64 * 1024
+# How long an upload request waits for extraction before answering 202
+UPLOAD_WAIT_SECONDS = 10
+# Finished upload jobs nobody has polled for this long are forgotten
+UPLOAD_JOB_TTL_SECONDS = 15 * 60
+
+# PDF parsing runs off the request thread. PDFium is not thread-safe, so a
+# single worker serializes extraction while request threads stay free.
+_extraction_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix='pdf-extract')
+# Uploads still running after UPLOAD_WAIT_SECONDS: job ID -> (future, last_polled_at)
+_upload_jobs: Dict[str, Tuple[Future, float]] = {}
+
+# Prefer the PDFium-backed extractor when available; PyPDF2 remains the fallback
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
+
+def _json(payload: Dict[str, Any], status: int = 200):
+    """Serialize a JSON response with orjson (faster than Flask's jsonify for large event lists)."""
+    try:
+        return Response(orjson.dumps(payload), status=status, mimetype='application/json')
+    except orjson.JSONEncodeError:
+        # Stored events hold client JSON as-is (e.g. integers beyond 64 bits)
+        return jsonify(payload), status
+
 def extract_text_from_pdf(file) -> str:
     """
     Extract text content from an uploaded PDF file.
     
+    Uses PDFium when pypdfium2 is installed and falls back to PyPDF2 when
+    it is missing or cannot read the file.
+    
     Args:
         file: Flask file object containing the PDF
         
@@ -32,15 +68,80 @@ def extract_text_from_pdf(file) -> str:
     Raises:
         Exception: If PDF reading fails
     """
+    if pdfium is not None:
+        stream = getattr(file, 'stream', file)
+        try:
+            pdf = pdfium.PdfDocument(stream)
+            try:
+                return "\n".join(page.get_textpage().get_text_bounded() for page in pdf)
+            finally:
+                pdf.close()
+        except pdfium.PdfiumError as e:
+            # PDFium rejected the file; retry from the start with PyPDF2
+            print(f"PDFium could not read PDF, falling back to PyPDF2: {str(e)}")  # Debug
+            stream.seek(0)
+    
     try:
         pdf_reader = PyPDF2.PdfReader(file)
-        text = ""
+        parts = []
         for page in pdf_reader.pages:
-            text += page.extract_text() + "\n"
-        return text
+            parts.append(page.extract_text())
+        return "\n".join(parts)
     except Exception as e:
         raise Exception(f"Error reading PDF: {str(e)}")
 
+def process_pdf_upload(spooled) -> Dict[str, Any]:
+    """
+    Extract deadlines from a spooled PDF and store them as events.
+    
+    Runs on the extraction worker thread and closes ``spooled`` when done.
+    
+    Args:
+        spooled: Seekable binary file holding the uploaded PDF
+        
+    Returns:
+        Dict: Response payload with the message, new events and total count
+    """
+    try:
+        # Extract text from PDF
+        text = extract_text_from_pdf(spooled)
+    finally:
+        spooled.close()
+    print(f"Extracted text length: {len(text)}")  # Debug
+    
+    # Extract deadlines using the advanced algorithm
+    extracted_events = extract_deadlines_from_text(text)
+    print(f"Extracted {len(extracted_events)} events")  # Debug
+    
+    # Convert to calendar events, reserving a contiguous block of IDs
+    base_id = reserve_event_ids(len(extracted_events))
+    
+    new_events = [
+        {
+            'id': base_id + i,
+            'title': event_data['title'],
+            'type': event_data['type'],
+            'start': event_data['start'],
+            'end': event_data['end'],
+            'allDay': event_data['allDay'],
+            'source': 'pdf_upload',
+            'extracted_from': event_data['extracted_from'],
+            'description': '',
+            'course': ''
+        }
+        for i, event_data in enumerate(extracted_events)
+    ]
+    
+    # Add events to storage in one batch
+    add_event_dicts(new_events)
+    
+    print(f"Successfully processed {len(new_events)} events")  # Debug
+    return {
+        'message': f'Successfully extracted {len(new_events)} deadlines from syllabus',
+        'events': new_events,
+        'total_events': len(get_all_events())
+    }
+
 def upload_pdf_handler():
     """
     Handle PDF upload and extract academic deadlines.
@@ -52,8 +153,11 @@ def upload_pdf_handler():
     4. Converts them to calendar events
     5. Stores them in memory
     
+    Steps 2-5 run on a worker thread. If they take longer than
+    UPLOAD_WAIT_SECONDS the request returns 202 with a job ID to poll.
+    
     Returns:
-        JSON response with extracted events or error message
+        JSON response with extracted events, a pending job ID, or error message
     """
     # Validate file upload
     if 'file' not in request.files:
@@ -67,44 +171,65 @@ def upload_pdf_handler():
         return jsonify({'error': 'File must be a PDF'}), 400
     
     try:
-        # Extract text from PDF
-        text = extract_text_from_pdf(file)
-        print(f"Extracted text length: {len(text)}")  # Debug
-        
-        # Extract deadlines using the advanced algorithm
-        extracted_events = extract_deadlines_from_text(text)
-        print(f"Extracted {len(extracted_events)} events")  # Debug
-        
-        # Convert to calendar events and store
-        new_events = []
-        global next_event_id
-        
-        for event_data in extracted_events:
-            event = {
-                'id': next_event_id,
-                'title': event_data['title'],
-                'type': event_data['type'],
-                'start': event_data['start'],
-                'end': event_data['end'],
-                'allDay': event_data['allDay'],
-                'source': 'pdf_upload',
-                'extracted_from': event_data['extracted_from'],
-                'description': '',
-                'course': ''
-            }
-            
-            # Add event directly to the events list
-            events.append(event)
-            new_events.append(event)
-            next_event_id += 1
-        
-        print(f"Successfully processed {len(new_events)} events")  # Debug
-        return jsonify({
-            'message': f'Successfully extracted {len(new_events)} deadlines from syllabus',
-            'events': new_events,
-            'total_events': len(get_all_events())
-        }), 200
+        # Copy the upload so the extraction worker can outlive the request;
+        # small PDFs stay in memory and larger ones go to a temp file
+        spooled = tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX_SIZE)
+        shutil.copyfileobj(file.stream, spooled, length=UPLOAD_COPY_CHUNK_SIZE)
+        spooled.seek(0)
+    except Exception as e:
+        print(f"Error in PDF upload: {str(e)}")  # Debug
+        return jsonify({'error': str(e)}), 500
+    
+    future = _extraction_pool.submit(process_pdf_upload, spooled)
+    try:
+        return _json(future.result(timeout=UPLOAD_WAIT_SECONDS))
+    except FutureTimeoutError:
+        # Large syllabus: let the client poll /upload-pdf/<job_id>
+        _expire_upload_jobs()
+        job_id = uuid.uuid4().hex
+        _upload_jobs[job_id] = (future, time.monotonic())
+        return _json({'message': 'Syllabus is still being processed', 'job_id': job_id}, 202)
+    except Exception as e:
+        print(f"Error in PDF upload: {str(e)}")  # Debug
+        return jsonify({'error': str(e)}), 500
+
+def _expire_upload_jobs() -> None:
+    """
+    Drop finished upload jobs whose client stopped polling.
+    
+    Running jobs are always kept, so a slow upload queued behind others
+    never loses its job ID while the worker is still going to store it.
+    """
+    cutoff = time.monotonic() - UPLOAD_JOB_TTL_SECONDS
+    for job_id, (future, last_polled_at) in list(_upload_jobs.items()):
+        if future.done() and last_polled_at < cutoff:
+            _upload_jobs.pop(job_id, None)
+
+def upload_status_handler(job_id: str):
+    """
+    Report the outcome of a PDF upload that outlived UPLOAD_WAIT_SECONDS.
+    
+    Args:
+        job_id: Job ID returned by a 202 response from /upload-pdf
         
+    Returns:
+        202 while processing, then the same response /upload-pdf would have given
+    """
+    _expire_upload_jobs()
+    job = _upload_jobs.get(job_id)
+    if job is None:
+        return jsonify({'error': 'Upload job not found'}), 404
+    
+    future = job[0]
+    if not future.done():
+        _upload_jobs[job_id] = (future, time.monotonic())
+        return _json({'message': 'Syllabus is still being processed', 'job_id': job_id}, 202)
+    
+    # Only one of several concurrent polls gets to claim the finished job
+    if _upload_jobs.pop(job_id, None) is None:
+        return jsonify({'error': 'Upload job not found'}), 404
+    try:
+        return _json(future.result())
     except Exception as e:
         print(f"Error in PDF upload: {str(e)}")  # Debug
         return jsonify({'error': str(e)}), 500
@@ -116,7 +241,7 @@ def get_events_handler():
     Returns:
         JSON response containing all events
     """
-    return jsonify({'events': get_all_events()}), 200
+    return _json({'events': get_all_events()})
 
 def create_event_handler():
     """
@@ -145,9 +270,8 @@ def create_event_handler():
             return jsonify({'error': f'Missing required field: {field}'}), 400
     
     # Create new event
-    global next_event_id
     event = {
-        'id': next_event_id,
+        'id': get_next_event_id(),
         'title': data['title'],
         'type': data.get('type', 'Assignment'),
         'start': data['start'],
@@ -159,9 +283,8 @@ def create_event_handler():
         'extracted_from': ''
     }
     
-    # Add event directly to the events list
-    events.append(event)
-    next_event_id += 1
+    # Add event to storage
+    add_event_dict(event)
     
     return jsonify({'message': 'Event created successfully', 'event': event}), 201
 
@@ -201,14 +324,57 @@ def delete_event_handler(event_id: int):
     Returns:
         JSON response with success/error message
     """
-    global events
-    original_length = len(events)
-    events = [e for e in events if e['id'] != event_id]
-    
-    if len(events) < original_length:
-        return jsonify({'message': 'Event deleted successfully'}), 200
-    else:
+    if not delete_event(event_id):
         return jsonify({'error': 'Event not found'}), 404
+    
+    return jsonify({'message': 'Event deleted successfully'}), 200
+
+def _ics_escape(value: Any) -> str:
+    """Escape a TEXT property value per RFC 5545 section 3.3.11."""
+    # Stored fields come straight from client JSON and may be null or non-text
+    value = '' if value is None else str(value)
+    return (value.replace('\\', '\\\\').replace(';', '\\;')
+            .replace(',', '\\,').replace('\r\n', '\\n').replace('\n', '\\n'))
+
+def _ics_datetime(value: str) -> str:
+    """Format a stored ISO datetime as an ICS DATE-TIME (UTC if zone-aware)."""
+    dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+    if dt.tzinfo is None:
+        return dt.strftime('%Y%m%dT%H%M%S')
+    return dt.astimezone(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+
+def _ics_line(name: str, value: str) -> str:
+    """Build one CRLF-terminated content line, folded at 75 octets."""
+    line = f"{name}:{value}"
+    if len(line) <= 75 and line.isascii():
+        return line + '\r\n'
+    
+    parts = []
+    octets = 0
+    for char in line:
+        size = len(char.encode('utf-8'))
+        if octets + size > 75:
+            parts.append('\r\n ')
+            octets = 1
+        parts.append(char)
+        octets += size
+    parts.append('\r\n')
+    return ''.join(parts)
+
+def _ics_event(event: Dict[str, Any], dtstamp: str) -> str:
+    """Serialize one stored event as a VEVENT block."""
+    return ''.join((
+        'BEGIN:VEVENT\r\n',
+        _ics_line('SUMMARY', _ics_escape(event['title'])),
+        _ics_line('DTSTART', _ics_datetime(event['start'])),
+        _ics_line('DTEND', _ics_datetime(event['end'])),
+        _ics_line('DTSTAMP', dtstamp),
+        _ics_line('UID', f"planner-pal-{event['id']}@plannerpal.com"),
+        _ics_line('CATEGORIES', _ics_escape(event['type'])),
+        _ics_line('DESCRIPTION', _ics_escape(event['description'])),
+        _ics_line('LOCATION', _ics_escape(event['course'])),
+        'END:VEVENT\r\n',
+    ))
 
 def export_ics_handler():
     """
@@ -216,66 +382,43 @@ def export_ics_handler():
     
     This function creates a standard iCalendar file that can be imported
     into Google Calendar, Outlook, Apple Calendar, and other calendar applications.
+    The file is streamed one VEVENT at a time rather than built in memory.
+    Events that cannot be serialized (e.g. unparseable dates) are skipped, since
+    an error can no longer be reported once the response has started.
     
     Returns:
         ICS file download response
     """
-    try:
-        # Create a new calendar
-        cal = Calendar()
-        cal.add('prodid', '-//Planner Pal//Academic Calendar//EN')
-        cal.add('version', '2.0')
-        cal.add('calscale', 'GREGORIAN')
-        cal.add('method', 'PUBLISH')
-        cal.add('X-WR-CALNAME', 'Planner Pal Academic Calendar')
-        cal.add('X-WR-CALDESC', 'Academic events and deadlines extracted from syllabi')
-        
-        # Add all events to the calendar
-        for event in events:
-            ical_event = ICalEvent()
-            
-            # Set event properties
-            ical_event.add('summary', event['title'])
-            ical_event.add('description', event.get('description', ''))
-            ical_event.add('location', event.get('course', ''))
-            
-            # Convert dates to datetime objects
-            start_dt = datetime.fromisoformat(event['start'].replace('Z', '+00:00'))
-            end_dt = datetime.fromisoformat(event['end'].replace('Z', '+00:00'))
-            
-            # Set start and end times
-            ical_event.add('dtstart', start_dt)
-            ical_event.add('dtend', end_dt)
-            
-            # Add event type as categories
-            ical_event.add('categories', [event.get('type', 'Assignment')])
-            
-            # Add unique identifier
-            ical_event.add('uid', f"planner-pal-{event['id']}@plannerpal.com")
-            
-            # Add creation timestamp
-            ical_event.add('dtstamp', datetime.now(pytz.UTC))
-            
-            # Add to calendar
-            cal.add_component(ical_event)
-        
-        # Generate ICS content
-        ics_content = cal.to_ical()
-        
-        # Create response
-        response = Response(
-            ics_content,
-            mimetype='text/calendar',
-            headers={
-                'Content-Disposition': 'attachment; filename=planner_pal_calendar.ics',
-                'Content-Type': 'text/calendar; charset=utf-8'
-            }
-        )
-        
-        return response
-        
-    except Exception as e:
-        return jsonify({'error': f'Failed to export calendar: {str(e)}'}), 500
+    # Timestamp shared by every event in this export
+    dtstamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%SZ')
+    # Snapshot so concurrent deletes don't affect an export in progress
+    snapshot = list(events)
+    
+    def generate():
+        yield ''.join((
+            'BEGIN:VCALENDAR\r\n',
+            _ics_line('VERSION', '2.0'),
+            _ics_line('PRODID', '-//Planner Pal//Academic Calendar//EN'),
+            _ics_line('CALSCALE', 'GREGORIAN'),
+            _ics_line('METHOD', 'PUBLISH'),
+            _ics_line('X-WR-CALDESC', 'Academic events and deadlines extracted from syllabi'),
+            _ics_line('X-WR-CALNAME', 'Planner Pal Academic Calendar'),
+        ))
+        for event in snapshot:
+            try:
+                yield _ics_event(event, dtstamp)
+            except Exception as e:
+                print(f"Skipping event {event.get('id')} in ICS export: {str(e)}")  # Debug
+        yield 'END:VCALENDAR\r\n'
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/calendar',
+        headers={
+            'Content-Disposition': 'attachment; filename=planner_pal_calendar.ics',
+            'Content-Type': 'text/calendar; charset=utf-8'
+        }
+    )
 
 def health_check_handler():
     """
@@ -68,12 +68,19 @@ function App() {
     formData.append("file", file);
 
     try {
-      const response = await fetch("http://localhost:5000/upload-pdf", {
+      let response = await fetch("http://localhost:5000/upload-pdf", {
         method: "POST",
         body: formData,
       });
 
-      const data = await response.json();
+      let data = await response.json();
+      // Large syllabi are processed in the background; poll until done
+      while (response.status === 202) {
+        setUploadStatus(data.message);
+        await new Promise(resolve => setTimeout(resolve, 1000));
+        response = await fetch(`http://localhost:5000/upload-pdf/${data.job_id}`);
+        data = await response.json();
+      }
       if (response.ok) {
         setUploadStatus(`Success: ${data.message}`);
         // Add new events to existing events instead of replacing them